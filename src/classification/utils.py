@@ -1,11 +1,10 @@
 def calculate_metrics(predictions, labels):
     # Function to calculate accuracy, precision, recall, and F1 score
-    from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
+    from sklearn.metrics import accuracy_score, precision_recall_fscore_support
 
     accuracy = accuracy_score(labels, predictions)
-    precision = precision_score(labels, predictions, average='weighted')
-    recall = recall_score(labels, predictions, average='weighted')
-    f1 = f1_score(labels, predictions, average='weighted')
+    # Precision, recall and F1 share one confusion-matrix pass
+    precision, recall, f1, _ = precision_recall_fscore_support(labels, predictions, average='weighted')
 
     return {
         'accuracy': accuracy,
@@ -1,4 +1,7 @@
 class CNNModel:
+    # Filter count of each Conv2D + MaxPooling2D block
+    CONV_FILTERS = (32, 64, 128)
+
     def __init__(self, input_shape, num_classes):
         self.input_shape = input_shape
         self.num_classes = num_classes
@@ -9,12 +12,11 @@ class CNNModel:
         from tensorflow.keras.layers import Conv2D, MaxPooling2D, Flatten, Dense, Dropout
 
         model = Sequential()
-        model.add(Conv2D(32, (3, 3), activation='relu', input_shape=self.input_shape))
-        model.add(MaxPooling2D(pool_size=(2, 2)))
-        model.add(Conv2D(64, (3, 3), activation='relu'))
-        model.add(MaxPooling2D(pool_size=(2, 2)))
-        model.add(Conv2D(128, (3, 3), activation='relu'))
-        model.add(MaxPooling2D(pool_size=(2, 2)))
+        for i, filters in enumerate(self.CONV_FILTERS):
+            # Only the first layer needs the input shape
+            kwargs = {'input_shape': self.input_shape} if i == 0 else {}
+            model.add(Conv2D(filters, (3, 3), activation='relu', **kwargs))
+            model.add(MaxPooling2D(pool_size=(2, 2)))
         model.add(Flatten())
         model.add(Dense(128, activation='relu'))
         model.add(Dropout(0.5))
@@ -1,7 +1,15 @@
-from tensorflow.keras.models import load_model
 import numpy as np
-import cv2
 import os
+from functools import lru_cache
+
+@lru_cache(maxsize=4)
+def _load_keras_model(model_path):
+    # Load each model file once and share it across predictor instances
+    from tensorflow.keras.models import load_model
+
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"Model file not found at {model_path}")
+    return load_model(model_path)
 
 class CNNModelPredictor:
     def __init__(self, model_path):
@@ -9,11 +17,11 @@ class CNNModelPredictor:
         self.model = self.load_model()
 
     def load_model(self):
-        if not os.path.exists(self.model_path):
-            raise FileNotFoundError(f"Model file not found at {self.model_path}")
-        return load_model(self.model_path)
+        return _load_keras_model(self.model_path)
 
     def preprocess_image(self, image_path):
+        import cv2
+
         image = cv2.imread(image_path)
         image = cv2.resize(image, (224, 224))  # Resize to match model input
         image = image.astype('float32') / 255.0  # Normalize to [0, 1]
@@ -22,10 +30,25 @@ class CNNModelPredictor:
 
     def predict(self, image_path):
         image = self.preprocess_image(image_path)
-        predictions = self.model.predict(image)
+        # Calling the model directly skips the per-call data pipeline setup of
+        # model.predict(), which dominates for a single-image batch
+        predictions = self.model(image, training=False).numpy()
+        return predictions
+
+    def predict_batch(self, image_paths):
+        # Stack several images (e.g. front and side photos) into one batch so
+        # the model runs a single forward pass over all of them
+        from concurrent.futures import ThreadPoolExecutor
+
+        # cv2 decode and resize release the GIL, so the images preprocess in parallel
+        with ThreadPoolExecutor() as executor:
+            images = list(executor.map(self.preprocess_image, image_paths))
+        images = np.concatenate(images, axis=0)
+        predictions = self.model(images, training=False).numpy()
         return predictions
 
 # Example usage:
 # predictor = CNNModelPredictor('path/to/your/model.h5')
 # result = predictor.predict('path/to/image.jpg')
-# print(result)
\ No newline at end of file
+# print(result)
+# results = predictor.predict_batch(['path/to/front.jpg', 'path/to/side.jpg'])
\ No newline at end of file
@@ -1,11 +1,10 @@
 import os
 import numpy as np
-import tensorflow as tf
-from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
-from sklearn.model_selection import train_test_split
 
 def load_data(data_directory, image_size=(224, 224), test_size=0.2):
+    import tensorflow as tf
+    from sklearn.model_selection import train_test_split
+
     # Load images and labels from the specified directory
     images = []
     labels = []
@@ -20,12 +19,15 @@ def load_data(data_directory, image_size=(224, 224), test_size=0.2):
                 images.append(img_array)
                 labels.append(label)
 
-    images = np.array(images) / 255.0  # Normalize images
+    images = np.array(images, dtype='float32')
+    images /= 255.0  # Normalize images in place to avoid a second full-size copy
     labels = np.array(labels)
 
     return train_test_split(images, labels, test_size=test_size, random_state=42)
 
 def train_model(model, train_data, train_labels, epochs=10, batch_size=32):
+    from tensorflow.keras.preprocessing.image import ImageDataGenerator
+
     # Compile the model
     model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
     
@@ -5,7 +5,7 @@ def preprocess_data(data):
 
 def transform_data(data):
     # Apply any necessary transformations to the data
-    transformed_data = data.apply(lambda x: x**2)  # Example transformation
+    transformed_data = data ** 2  # Example transformation, applied to the whole frame at once
     return transformed_data
 
 def load_and_preprocess_data(file_path):
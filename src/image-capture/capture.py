@@ -6,44 +6,52 @@ mp_pose = mp.solutions.pose
 pose = mp_pose.Pose()
 mp_drawing = mp.solutions.drawing_utils
 
+# Landmark indices used by the posture check, resolved once instead of per frame
+LEFT_SHOULDER = mp_pose.PoseLandmark.LEFT_SHOULDER.value
+RIGHT_SHOULDER = mp_pose.PoseLandmark.RIGHT_SHOULDER.value
+
 # Start OpenCV Webcam Feed
 cap = cv2.VideoCapture(0)
 
-while cap.isOpened():
-    ret, frame = cap.read()
-    if not ret:
-        break
-
-    # Convert the frame to RGB (required by MediaPipe)
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-    # Process the frame with MediaPipe Pose
-    results = pose.process(rgb_frame)
-
-    # Draw pose landmarks on the frame
-    if results.pose_landmarks:
-        mp_drawing.draw_landmarks(frame, results.pose_landmarks, mp_pose.POSE_CONNECTIONS)
-
-        # Example: Check if the user is standing straight (custom logic can be added here)
-        # You can use landmarks like shoulders, hips, etc., to validate the pose
-        landmarks = results.pose_landmarks.landmark
-        left_shoulder = landmarks[mp_pose.PoseLandmark.LEFT_SHOULDER.value]
-        right_shoulder = landmarks[mp_pose.PoseLandmark.RIGHT_SHOULDER.value]
-
-        if abs(left_shoulder.y - right_shoulder.y) < 0.05:  # Example condition for straight posture
-            cv2.putText(frame, "Pose Correct! Press 'c' to capture.", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-        else:
-            cv2.putText(frame, "Adjust your posture!", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-
-    # Display the frame
-    cv2.imshow('Pose Detection', frame)
-
-    # Capture the image when 'c' is pressed
-    if cv2.waitKey(1) & 0xFF == ord('c'):
-        cv2.imwrite('captured_image.jpg', frame)
-        print("Image captured and saved as 'captured_image.jpg'")
-        break
-
-# Release resources
-cap.release()
-cv2.destroyAllWindows()
\ No newline at end of file
+try:
+    while cap.isOpened():
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        # Convert the frame to RGB (required by MediaPipe)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # A read-only frame is passed to MediaPipe by reference instead of copied
+        rgb_frame.flags.writeable = False
+
+        # Process the frame with MediaPipe Pose
+        results = pose.process(rgb_frame)
+
+        # Draw pose landmarks on the frame
+        if results.pose_landmarks:
+            mp_drawing.draw_landmarks(frame, results.pose_landmarks, mp_pose.POSE_CONNECTIONS)
+
+            # Example: Check if the user is standing straight (custom logic can be added here)
+            # You can use landmarks like shoulders, hips, etc., to validate the pose
+            landmarks = results.pose_landmarks.landmark
+            left_shoulder = landmarks[LEFT_SHOULDER]
+            right_shoulder = landmarks[RIGHT_SHOULDER]
+
+            if abs(left_shoulder.y - right_shoulder.y) < 0.05:  # Example condition for straight posture
+                cv2.putText(frame, "Pose Correct! Press 'c' to capture.", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            else:
+                cv2.putText(frame, "Adjust your posture!", (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+
+        # Display the frame
+        cv2.imshow('Pose Detection', frame)
+
+        # Capture the image when 'c' is pressed
+        if cv2.waitKey(1) & 0xFF == ord('c'):
+            cv2.imwrite('captured_image.jpg', frame)
+            print("Image captured and saved as 'captured_image.jpg'")
+            break
+finally:
+    # Release resources even if the loop raises or is interrupted
+    cap.release()
+    pose.close()
+    cv2.destroyAllWindows()
\ No newline at end of file
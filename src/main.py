@@ -1,6 +1,5 @@
 # main.py
 
-import sys
 from cnn_model.train import train_model
 from cnn_model.predict import predict
 from classification.classifier import Classifier
@@ -1,3 +1,10 @@
+# Base diet recommendation for each somatotype
+SOMATOTYPE_DIETS = {
+    'ectomorph': 'High-calorie diet with protein-rich foods',
+    'mesomorph': 'Balanced diet with a mix of protein, carbs, and fats',
+    'endomorph': 'Low-carb diet with high protein intake',
+}
+
 class Recommender:
     def __init__(self, user_preferences, cnn_outputs):
         self.user_preferences = user_preferences
@@ -7,12 +14,9 @@ class Recommender:
         recommendations = []
         # Logic to generate diet recommendations based on user preferences and CNN outputs
         # This is a placeholder for the actual recommendation logic
-        if self.cnn_outputs['somatotype'] == 'ectomorph':
-            recommendations.append('High-calorie diet with protein-rich foods')
-        elif self.cnn_outputs['somatotype'] == 'mesomorph':
-            recommendations.append('Balanced diet with a mix of protein, carbs, and fats')
-        elif self.cnn_outputs['somatotype'] == 'endomorph':
-            recommendations.append('Low-carb diet with high protein intake')
+        diet = SOMATOTYPE_DIETS.get(self.cnn_outputs['somatotype'])
+        if diet is not None:
+            recommendations.append(diet)
 
         # Further refine recommendations based on user preferences
         recommendations = self.refine_recommendations(recommendations)
@@ -20,13 +24,14 @@ class Recommender:
 
     def refine_recommendations(self, recommendations):
         refined_recommendations = []
+        is_vegetarian = 'vegetarian' in self.user_preferences
         for recommendation in recommendations:
-            if 'vegetarian' in self.user_preferences and 'meat' in recommendation:
+            if is_vegetarian and 'meat' in recommendation:
                 continue
             refined_recommendations.append(recommendation)
         return refined_recommendations
 
     def display_recommendations(self):
         recommendations = self.generate_recommendations()
-        for rec in recommendations:
-            print(f'Recommendation: {rec}')
\ No newline at end of file
+        if recommendations:
+            print('\n'.join(f'Recommendation: {rec}' for rec in recommendations))
\ No newline at end of file
@@ -1,3 +1,6 @@
+# Dietary preferences accepted by validate_preferences
+VALID_PREFERENCES = frozenset(['vegetarian', 'vegan', 'gluten-free', 'high-protein', 'low-carb'])
+
 def handle_user_preferences(preferences):
     # Process user preferences for diet recommendations
     processed_preferences = {}
@@ -15,8 +18,7 @@ def format_recommendations(recommendations):
 
 def validate_preferences(preferences):
     # Validate user preferences to ensure they are acceptable
-    valid_preferences = ['vegetarian', 'vegan', 'gluten-free', 'high-protein', 'low-carb']
     for preference in preferences:
-        if preference not in valid_preferences:
+        if preference not in VALID_PREFERENCES:
             raise ValueError(f"Invalid preference: {preference}")
     return True
\ No newline at end of file
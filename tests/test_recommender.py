@@ -1,7 +1,7 @@
 # Contents of /diet-recommendation-somatotype/diet-recommendation-somatotype/tests/test_recommender.py
 
 import unittest
-from src.recommendation.recommender import Recommender
+from src.recommendation.recommender import Recommender, SOMATOTYPE_DIETS
 
 class TestRecommender(unittest.TestCase):
 
@@ -41,5 +41,16 @@ class TestRecommender(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.recommender.generate_recommendations(user_preferences, cnn_output)
 
+class TestSomatotypeDiets(unittest.TestCase):
+
+    def test_each_somatotype_has_a_diet(self):
+        for somatotype, diet in SOMATOTYPE_DIETS.items():
+            recommender = Recommender({}, {'somatotype': somatotype})
+            self.assertEqual(recommender.generate_recommendations(), [diet])
+
+    def test_unknown_somatotype(self):
+        recommender = Recommender({}, {'somatotype': 'unknown'})
+        self.assertEqual(recommender.generate_recommendations(), [])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file